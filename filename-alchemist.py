@@ -2,12 +2,398 @@ import subprocess
 import sys
 import os
 import re
+import time
+import asyncio
+import threading
 import json
+import hashlib
+import shutil
+import struct
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from tkinter import *
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import IndirectObject, NameObject, DictionaryObject, ArrayObject
+
+class AsyncFileIO:
+    """Asyncio front end for blocking filesystem and PDF calls.
+
+    Calls run on a thread pool and a semaphore caps how many are in flight,
+    so a slow network or FUSE mount is kept busy without being flooded. It
+    has no Tk dependency and can be driven from the GUI or a script:
+
+        io_layer = AsyncFileIO(concurrency=32)
+        page_counts = io_layer.gather(io_layer.pdf_page_count, paths)
+        print(io_layer.iops)
+    """
+    DEFAULT_CONCURRENCY = 16
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, int(concurrency))
+        self.operations = 0
+        self.elapsed = 0.0
+        self._executor = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._executor.shutdown(wait=True)
+        self.elapsed += time.perf_counter() - self._started
+
+    async def run(self, func, *args):
+        async with self._semaphore:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        self.operations += 1
+        return result
+
+    async def listdir(self, folder):
+        return await self.run(os.listdir, folder)
+
+    async def pdf_page_count(self, path):
+        # Only the count is kept, so readers are released as soon as they are parsed
+        return await self.run(self.count_pages, path)
+
+    async def rename(self, source, destination):
+        return await self.run(os.rename, source, destination)
+
+    @staticmethod
+    def count_pages(path):
+        return len(PdfReader(path).pages)
+
+    def gather(self, coroutine_function, items):
+        """Run coroutine_function(item) for every item and wait for all of them.
+
+        Results come back in input order; a failed call yields its exception
+        instead of aborting the batch. Items that are tuples are unpacked.
+        """
+        async def run_batch():
+            async with self:
+                return await asyncio.gather(
+                    *(coroutine_function(*item) if isinstance(item, tuple) else coroutine_function(item)
+                      for item in items),
+                    return_exceptions=True)
+        return asyncio.run(run_batch())
+
+    @property
+    def iops(self):
+        """Completed operations per second across all batches run so far."""
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+
+class JobLedger:
+    """Append-only record of processed files, used to resume PDF batch jobs.
+
+    Each line of the ledger is a JSON object with the file name, operation,
+    input hash and output hash. A record is synced to disk before the output
+    replaces the original file, so after a crash a file either still has its
+    input hash (and is processed again) or already matches a recorded output
+    hash (and is skipped).
+    """
+    FILENAME = '.alchemist_ledger.jsonl'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, folder):
+        self.path = os.path.join(folder, self.FILENAME)
+        self.completed = set()
+        self.record_count = 0
+        self._needs_newline = False
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self._needs_newline = not line.endswith('\n')
+                try:
+                    record = json.loads(line)
+                    self.completed.add((record['operation'], record['output_hash']))
+                    self.record_count += 1
+                except (ValueError, KeyError):
+                    # Partial last line from an interrupted write
+                    continue
+
+    def is_done(self, operation, file_hash):
+        """True if file_hash is the recorded output of operation, i.e. the file was already processed."""
+        return (operation, file_hash) in self.completed
+
+    def record(self, filename, operation, input_hash, output_hash):
+        record = {
+            'file': filename,
+            'operation': operation,
+            'input_hash': input_hash,
+            'output_hash': output_hash,
+            'timestamp': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if self._needs_newline:
+                f.write('\n')
+                self._needs_newline = False
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.add((operation, output_hash))
+        self.record_count += 1
+
+    def archive(self):
+        """Move the ledger aside so every file is processed again. Returns the archive path, or None."""
+        self.completed = set()
+        self.record_count = 0
+        self._needs_newline = False
+        if not os.path.exists(self.path):
+            return None
+        stem, ext = os.path.splitext(self.path)
+        archive_path = f"{stem}.{datetime.now().strftime('%Y%m%d-%H%M%S')}{ext}"
+        os.replace(self.path, archive_path)
+        return archive_path
+
+    @classmethod
+    def hash_file(cls, path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+class PdfResultCache:
+    """Content-addressed store of PDF outputs, keyed on input hash and operation.
+
+    When the same input (e.g. an annex copied for every country) goes through
+    the same operation again, the stored output is copied into place instead
+    of re-parsing and re-writing the PDF. Copies are never hard links, so the
+    user's files stay independent of the cache and of each other. Entries are
+    checked against their recorded hash while being copied and are evicted
+    least recently used first once the cache grows past max_bytes.
+
+    The cache is best-effort: if its directory cannot be written (read-only
+    home, full disk, quota) lookups count as misses and the PDF operations
+    carry on without it.
+    """
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".filename_alchemist", "cache")
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    INDEX_FILENAME = 'index.json'
+    # Younger temp files may belong to a store() in another running instance
+    STALE_TEMP_AGE = 24 * 60 * 60
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.failures = 0
+        # Batch jobs fetch and store from several worker threads
+        self.lock = threading.RLock()
+        # Reconciled on first use, so starting the app never scans the cache
+        self.loaded = False
+
+    @property
+    def total_bytes(self):
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def ensure_loaded(self):
+        with self.lock:
+            if not self.loaded:
+                self.load()
+
+    def load(self):
+        """Read the index and reconcile it with the files actually in the cache.
+
+        The index is only saved at the end of a batch, so after a crash or kill
+        stored outputs can be missing from it. Those are re-indexed as the
+        oldest entries, and the size limit is enforced again.
+        """
+        self.loaded = True
+        index_path = os.path.join(self.directory, self.INDEX_FILENAME)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                # Stored oldest first, so the LRU order survives restarts
+                indexed = OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            indexed = OrderedDict()
+            
+        try:
+            cached_files = os.listdir(self.directory)
+        except OSError:
+            cached_files = []
+            
+        on_disk = set()
+        orphans = OrderedDict()
+        for name in cached_files:
+            path = os.path.join(self.directory, name)
+            try:
+                if name.endswith('.tmp'):
+                    # Left over from an interrupted store() or save()
+                    if time.time() - os.path.getmtime(path) > self.STALE_TEMP_AGE:
+                        os.remove(path)
+                elif name.endswith('.pdf'):
+                    key = name[:-len('.pdf')]
+                    if key not in indexed:
+                        orphans[key] = {'size': os.path.getsize(path), 'output_hash': JobLedger.hash_file(path)}
+                    on_disk.add(key)
+            except OSError:
+                # Removed or replaced by another instance meanwhile
+                continue
+                    
+        self.entries = orphans
+        self.entries.update((key, entry) for key, entry in indexed.items() if key in on_disk)
+        self.evict()
+        if orphans or len(self.entries) != len(indexed):
+            self.save()
+
+    def save(self):
+        if not self.loaded:
+            return
+        index_path = os.path.join(self.directory, self.INDEX_FILENAME)
+        with self.lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(f"{index_path}.tmp", 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                os.replace(f"{index_path}.tmp", index_path)
+            except OSError:
+                # Entries not in the index are picked up again by load()
+                self.failures += 1
+
+    def make_key(self, input_hash, operation):
+        return hashlib.sha256(f"{input_hash}\0{operation}".encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def fetch(self, input_hash, operation, destination):
+        """Place the cached output at destination. Returns its hash, or None on a miss."""
+        self.ensure_loaded()
+        key = self.make_key(input_hash, operation)
+        with self.lock:
+            entry = self.entries.get(key)
+            
+        if entry is not None:
+            # Errors writing destination are raised, they say nothing about the entry
+            if self.materialise(self.entry_path(key), destination, entry['output_hash']):
+                with self.lock:
+                    if key in self.entries:
+                        self.entries.move_to_end(key)
+                    self.hits += 1
+                return entry['output_hash']
+            # Missing or modified since it was stored
+            self.discard(key)
+            
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def store(self, input_hash, operation, output_path):
+        """Copy output_path into the cache and return its hash.
+
+        If the cache cannot be written the output is only hashed; errors
+        reading output_path itself are raised.
+        """
+        self.ensure_loaded()
+        key = self.make_key(input_hash, operation)
+        temp_path = None
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Unique temp name, two workers may store the same key at once
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            with open(output_path, 'rb') as source, os.fdopen(fd, 'wb') as target:
+                for chunk in iter(lambda: source.read(JobLedger.HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    target.write(chunk)
+                    size += len(chunk)
+            os.replace(temp_path, self.entry_path(key))
+        except OSError:
+            if temp_path is not None and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            with self.lock:
+                self.failures += 1
+            return JobLedger.hash_file(output_path)
+            
+        output_hash = digest.hexdigest()
+        with self.lock:
+            self.entries[key] = {'size': size, 'output_hash': output_hash}
+            self.entries.move_to_end(key)
+            self.evict()
+        return output_hash
+
+    def evict(self):
+        # Always keep the newest entry, even if it alone exceeds the limit
+        with self.lock:
+            while len(self.entries) > 1 and self.total_bytes > self.max_bytes:
+                key = next(iter(self.entries))
+                self.discard(key)
+                self.evictions += 1
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+            try:
+                os.remove(self.entry_path(key))
+            except OSError:
+                # Already gone, or still open for a copy (Windows); load() tidies up later
+                pass
+
+    def materialise(self, cached_path, destination, expected_hash):
+        """Copy a cached output to destination, verifying its hash in the same pass.
+
+        Returns False, leaving destination untouched, if the entry is missing or
+        was modified. Errors writing destination are raised.
+        """
+        try:
+            source = open(cached_path, 'rb')
+        except OSError:
+            return False
+            
+        temp_path = f"{destination}.cache.tmp"
+        digest = hashlib.sha256()
+        try:
+            with source, open(temp_path, 'wb') as target:
+                for chunk in iter(lambda: source.read(JobLedger.HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    target.write(chunk)
+            if digest.hexdigest() != expected_hash:
+                os.remove(temp_path)
+                return False
+            os.replace(temp_path, destination)
+            return True
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def stats(self):
+        with self.lock:
+            return self.format_stats()
+
+    def format_stats(self):
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0
+        summary = (f"Cache: {self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate), "
+                   f"{self.evictions} evicted, {self.total_bytes / (1024 * 1024):.1f} MB used")
+        if self.failures:
+            summary += f", {self.failures} cache writes failed"
+        return summary
+
 
 class FileTools:
     FORMAT_OPTIONS = [
@@ -37,6 +423,33 @@ class FileTools:
         '.xls': 'Excel files (legacy)'
  }
 
+    # Seconds between refreshes of the match statistics panel while scanning
+    STATS_REFRESH_INTERVAL = 0.1
+    MATCH_TYPES = [
+        ("country", "Country"),
+        ("alpha2", "Alpha-2"),
+        ("alpha3", "Alpha-3"),
+        ("language", "Language")
+    ]
+    MERGE_ORDER_OPTIONS = ["By filename", "By country code", "From manifest"]
+
+    # Office Open XML formats whose docProps we can keep in sync after a rename.
+    # Legacy .xls is an OLE compound file and is only renamed.
+    OFFICE_METADATA_EXTENSIONS = ('.docx', '.xlsx')
+    OFFICE_NAMESPACES = {
+        'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+        'dc': 'http://purl.org/dc/elements/1.1/',
+        'dcterms': 'http://purl.org/dc/terms/',
+        'dcmitype': 'http://purl.org/dc/dcmitype/',
+        'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+        'vt': 'http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes'
+    }
+    CUSTOM_PROPERTIES_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/custom-properties'
+    CUSTOM_PROPERTIES_FMTID = '{D5CDD505-2E9C-101B-9397-08002B2CF9AE}'
+    CUSTOM_COUNTRY_PROPERTY = 'Country'
+    CUSTOM_PROPERTIES_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.custom-properties+xml'
+    CUSTOM_PROPERTIES_RELATIONSHIP = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/custom-properties'
+
     def __init__(self, root):
         self.root = root
         self.root.title("File Alchemist 1.0")
@@ -56,29 +469,48 @@ class FileTools:
         self.case_format = StringVar(value=self.CASE_OPTIONS[0][1])
         self.files_data = []
         self.tooltip = None
+        self.io_concurrency = IntVar(value=AsyncFileIO.DEFAULT_CONCURRENCY)
+        self.pdf_cache = PdfResultCache()
+        self.scanning = False
+        self.case_insensitive_folders = {}
+
+        # Keep the standard docProps prefixes when core.xml is re-serialised
+        for prefix, uri in self.OFFICE_NAMESPACES.items():
+            ET.register_namespace(prefix, uri)
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(expand=True, fill='both')
         
+        # Settings shared by every tab
+        settings_frame = ttk.Frame(root, padding=(10, 0, 10, 5))
+        settings_frame.pack(fill='x')
+        ttk.Label(settings_frame, text="I/O Concurrency:").pack(side=LEFT)
+        ttk.Spinbox(settings_frame, from_=1, to=256, textvariable=self.io_concurrency, width=8).pack(side=LEFT, padx=5)
+        ttk.Label(settings_frame, text="(parallel file operations in every tab, raise for network drives)").pack(side=LEFT)
+        
         # Initialize tabs
         self.country_code_tab = ttk.Frame(self.notebook)
         self.pdf_remove_tab = ttk.Frame(self.notebook)
         self.pdf_extract_tab = ttk.Frame(self.notebook)
+        self.pdf_merge_tab = ttk.Frame(self.notebook)
         
         # Add tabs to notebook
         self.notebook.add(self.country_code_tab, text='Country Code Converter')
         self.notebook.add(self.pdf_remove_tab, text='PDF Page Remover')
         self.notebook.add(self.pdf_extract_tab, text='PDF Page Extractor')
+        self.notebook.add(self.pdf_merge_tab, text='PDF Merger')
         
         # Load country mappings
         self.country_mappings = self.load_country_mappings()
         self.language_to_country = self.create_language_mapping()
+        self.code_index = self.create_code_index()
         
         # Initialize components for each tab
         self.setup_country_code_converter()
         self.setup_pdf_page_remover()
         self.setup_pdf_page_extractor()
+        self.setup_pdf_merger()
 
     def create_language_mapping(self):
         language_map = {}
@@ -92,6 +524,15 @@ class FileTools:
                     'alpha3': data['alpha3']
                 })
         return language_map
+
+    def create_code_index(self):
+        """Map lowercase alpha-2 codes, alpha-3 codes and names to country names."""
+        code_index = {'alpha2': {}, 'alpha3': {}, 'country': {}}
+        for country, data in self.country_mappings.items():
+            code_index['alpha2'].setdefault(data['alpha2'].lower(), country)
+            code_index['alpha3'].setdefault(data['alpha3'].lower(), country)
+            code_index['country'].setdefault(country.lower(), country)
+        return code_index
     
     def load_country_mappings(self):
         try:
@@ -151,10 +592,15 @@ class FileTools:
         self.replace_spaces = BooleanVar(value=False)
         ttk.Checkbutton(main_frame, text="Replace spaces with underscores", 
                        variable=self.replace_spaces).grid(row=4, column=0, columnspan=3, sticky=W, pady=5)
+
+        # Office metadata option
+        self.update_office_metadata = BooleanVar(value=False)
+        ttk.Checkbutton(main_frame, text="Update Office metadata (title, subject, country)", 
+                       variable=self.update_office_metadata).grid(row=5, column=0, columnspan=3, sticky=W, pady=5)
         
         # Pattern frame - make entries wider
         pattern_frame = ttk.LabelFrame(main_frame, text="Pattern", padding="5")
-        pattern_frame.grid(row=5, column=0, columnspan=3, sticky=(W, E), pady=5)
+        pattern_frame.grid(row=6, column=0, columnspan=3, sticky=(W, E), pady=5)
         
         ttk.Label(pattern_frame, text="Search Pattern:").grid(row=0, column=0, sticky=W)
         self.search_pattern = ttk.Entry(pattern_frame, width=50)  # Changed from 30 to 50
@@ -166,28 +612,36 @@ class FileTools:
 
         # Preview frame with wider treeview
         preview_frame = ttk.LabelFrame(main_frame, text="Preview", padding="5")
-        preview_frame.grid(row=6, column=0, columnspan=3, sticky=(N, W, E, S), pady=5)
+        preview_frame.grid(row=7, column=0, columnspan=3, sticky=(N, W, E, S), pady=5)
 
         # Add progress display frame
         self.progress_frame = ttk.LabelFrame(main_frame, text="Match Statistics", padding="5")
-        self.progress_frame.grid(row=7, column=0, columnspan=3, sticky=(W, E), pady=5)
+        self.progress_frame.grid(row=8, column=0, columnspan=3, sticky=(W, E), pady=5)
         
-        # Create a frame for the React component
-        self.progress_display = ttk.Frame(self.progress_frame, height=50)
-        self.progress_display.grid(row=0, column=0, sticky=(W, E))
+        # Live statistics, refreshed from the scan counters
+        self.match_progress = ttk.Progressbar(self.progress_frame, orient=HORIZONTAL, mode='determinate')
+        self.match_progress.grid(row=0, column=0, sticky=(W, E))
         
-        # Move button frame to row 8
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=8, column=0, columnspan=3, pady=10)
+        self.match_rate_var = StringVar()
+        self.match_breakdown_var = StringVar()
+        self.match_speed_var = StringVar()
+        ttk.Label(self.progress_frame, textvariable=self.match_rate_var).grid(row=1, column=0, sticky=W)
+        ttk.Label(self.progress_frame, textvariable=self.match_breakdown_var).grid(row=2, column=0, sticky=W)
+        ttk.Label(self.progress_frame, textvariable=self.match_speed_var).grid(row=3, column=0, sticky=W)
+        self.progress_frame.columnconfigure(0, weight=1)
+        self.reset_match_statistics()
         
         # Set up treeview with column widths
-        self.tree = ttk.Treeview(preview_frame, columns=("Original", "New"), show="headings")
+        self.tree = ttk.Treeview(preview_frame, columns=("Original", "New", "Status"), show="headings")
         self.tree.heading("Original", text="Original Filename")
         self.tree.heading("New", text="New Filename")
+        self.tree.heading("Status", text="Status")
         
         # Set specific column widths
-        self.tree.column("Original", width=350)  # Increased column width
-        self.tree.column("New", width=350)       # Increased column width
+        self.tree.column("Original", width=280)  # Increased column width
+        self.tree.column("New", width=280)       # Increased column width
+        self.tree.column("Status", width=140)
+        self.tree.tag_configure("collision", foreground="red")
         
         self.tree.grid(row=0, column=0, sticky=(N, W, E, S))
         
@@ -198,18 +652,27 @@ class FileTools:
         # Status and buttons (these automatically adjust)
         self.status_var = StringVar(value="Ready")
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=SUNKEN, anchor=W)
-        status_bar.grid(row=8, column=0, columnspan=3, sticky=(W, E))
+        status_bar.grid(row=11, column=0, columnspan=3, sticky=(W, E))
         
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=7, column=0, columnspan=3, pady=10)
+        button_frame.grid(row=9, column=0, columnspan=3, pady=10)
         
         ttk.Button(button_frame, text="Preview", command=self.preview_changes).grid(row=0, column=0, padx=5)
         ttk.Button(button_frame, text="Apply Changes", command=self.apply_changes).grid(row=0, column=1, padx=5)
         ttk.Button(button_frame, text="Reset", command=self.reset_ui).grid(row=0, column=2, padx=5)
 
+        # Inputs and buttons locked while a preview scan is running
+        self.converter_controls = []
+        pending = [main_frame]
+        while pending:
+            widget = pending.pop()
+            if isinstance(widget, (ttk.Entry, ttk.Button, ttk.Checkbutton)):  # Combobox is an Entry
+                self.converter_controls.append(widget)
+            pending.extend(widget.winfo_children())
+
         # Configure grid weights
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(6, weight=1)
+        main_frame.rowconfigure(7, weight=1)
         preview_frame.columnconfigure(0, weight=1)
         preview_frame.rowconfigure(0, weight=1)
 
@@ -217,14 +680,14 @@ class FileTools:
         supported_types_str = ", ".join(f"*{ext}" for ext in self.SUPPORTED_EXTENSIONS)
         ttk.Label(main_frame, 
                 text=f"Supported file types: {supported_types_str}", 
-                font=("", 8, "italic")).grid(row=9, column=0, columnspan=3, sticky=W, pady=(5,0))
+                font=("", 8, "italic")).grid(row=10, column=0, columnspan=3, sticky=W, pady=(5,0))
 
          # Add separator line
-        ttk.Separator(main_frame, orient='horizontal').grid(row=11, column=0, columnspan=3, sticky=(W, E), pady=10)
+        ttk.Separator(main_frame, orient='horizontal').grid(row=12, column=0, columnspan=3, sticky=(W, E), pady=10)
         
         # Credits frame
         credits_frame = ttk.Frame(main_frame)
-        credits_frame.grid(row=12, column=0, columnspan=3, sticky=(W, E), pady=(0, 10))
+        credits_frame.grid(row=13, column=0, columnspan=3, sticky=(W, E), pady=(0, 10))
         
         # Credits text with styled font
         credits_text = "File Alchemist 1.0 by Federico"
@@ -310,24 +773,37 @@ class FileTools:
         
         return None
     
+    def lookup_code(self, code):
+        """Return (country name, match type) for a code, or (None, None).
+
+        ISO codes win over country names, and both win over language codes,
+        so e.g. "fr" is France rather than the first French-speaking country.
+        """
+        code_lower = code.lower()
+        for match_type in ('alpha2', 'alpha3', 'country'):
+            if code_lower in self.code_index[match_type]:
+                return self.code_index[match_type][code_lower], match_type
+        if code_lower in self.language_to_country:
+            return self.language_to_country[code_lower][0]['country'], 'language'
+        return None, None
+
+    def find_country(self, code, code_type):
+        """Return (country name, mapping entry) for a country name or code."""
+        if code_type == "country":
+            country_name = self.code_index['country'].get(code.lower())
+        else:
+            country_name, _ = self.lookup_code(code)
+            
+        if country_name is None:
+            return None, None
+        return country_name, self.country_mappings[country_name]
+
     def convert_code(self, code, code_type):
+        country_name, country_entry = self.find_country(code, code_type)
+        return self.format_country(country_name, country_entry)
+
+    def format_country(self, country_name, country_entry):
         output_format = self.get_format_value()
-        country_entry = None
-        country_name = None
-        
-        code_lower = code.lower()
-        
-        for country, data in self.country_mappings.items():
-            if code_type == "country" and country.lower() == code_lower:
-                country_entry = data
-                country_name = country
-                break
-            elif code_type == "code":
-                if code_lower in [data['alpha2'].lower(), data['alpha3'].lower()] or \
-                code_lower in [lang.lower() for lang in data['languages'].split(',')]:
-                    country_entry = data
-                    country_name = country
-                    break
                
         if country_entry:
             if output_format == "alpha2":
@@ -401,6 +877,13 @@ class FileTools:
         self.rename_pattern.delete(0, END)
         self.rename_pattern.insert(0, rename_pattern)
     
+    def create_io_layer(self):
+        try:
+            concurrency = int(self.io_concurrency.get())
+        except (TclError, ValueError):
+            concurrency = AsyncFileIO.DEFAULT_CONCURRENCY
+        return AsyncFileIO(concurrency)
+
     def get_format_value(self):
         display_text = self.output_format.get()
         for value, text in self.FORMAT_OPTIONS:
@@ -418,14 +901,16 @@ class FileTools:
             messagebox.showwarning("Warning", "Please provide a sample filename first")
             return
 
+        # Converter controls are disabled while scanning, this guards stray calls
+        if self.scanning:
+            return
+
         # Clear existing preview
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        # Initialize counters and lists
+        # Initialize lists
         self.files_data = []
-        matched_files = 0
-        total_files = 0
         unmatched_files = []
 
         # Compile the pattern
@@ -437,69 +922,72 @@ class FileTools:
             return
 
         # Process each file in the directory
-        for filename in os.listdir(self.current_folder.get()):
-            name, ext = os.path.splitext(filename)
-            if ext.lower() in self.SUPPORTED_EXTENSIONS:
-                total_files += 1
-                match = compiled_pattern.match(name)
-                if match:
-                    code = match.group('code')
-                    # First try as country name
-                    if code.lower() in [c.lower() for c in self.country_mappings]:
-                        new_code = self.convert_code(code, "country")
-                    else:
-                        # Then try as code
-                        new_code = self.convert_code(code, "code")
+        folder = self.current_folder.get()
+        io_layer = self.create_io_layer()
+        folder_listing = io_layer.gather(io_layer.listdir, [folder])[0]
+        if isinstance(folder_listing, Exception):
+            messagebox.showerror("Error", f"Could not read folder: {str(folder_listing)}")
+            return
+        candidates = [f for f in folder_listing if os.path.splitext(f)[1].lower() in self.SUPPORTED_EXTENSIONS]
+        
+        # Counters fed to the statistics panel as files are scanned
+        stats = {
+            'total': len(candidates),
+            'scanned': 0,
+            'matched': 0,
+            'types': {match_type: 0 for match_type, _ in self.MATCH_TYPES},
+            'started': time.perf_counter()
+        }
+        scan = {
+            'folder': folder,
+            'folder_listing': folder_listing,
+            'candidates': candidates,
+            'pattern': compiled_pattern,
+            'country_names': {c.lower() for c in self.country_mappings},
+            'stats': stats,
+            'unmatched_files': unmatched_files
+        }
+        
+        # Scan in slices from the event loop, so the window keeps redrawing
+        # without letting other converter callbacks run mid-scan
+        self.scanning = True
+        self.set_converter_controls_enabled(False)
+        self.root.after(0, self.scan_chunk, scan)
+
+    def scan_chunk(self, scan):
+        """Match files for one refresh interval, then reschedule or finish the scan."""
+        stats = scan['stats']
+        chunk_started = time.perf_counter()
+        try:
+            while stats['scanned'] < stats['total']:
+                filename = scan['candidates'][stats['scanned']]
+                self.match_file(filename, scan['pattern'], scan['country_names'], stats, scan['unmatched_files'])
+                stats['scanned'] += 1
+                
+                if time.perf_counter() - chunk_started >= self.STATS_REFRESH_INTERVAL:
+                    self.update_match_statistics(stats)
+                    self.root.after(1, self.scan_chunk, scan)
+                    return
                     
-                    if new_code:
-                        # Apply case formatting
-                        case_format = self.case_format.get()
-                        if case_format == "lowercase":
-                            new_code = new_code.lower()
-                        elif case_format == "Capitalise":
-                            new_code = new_code.title()
-                        elif case_format == "UPPERCASE":
-                            new_code = new_code.upper()
-                        
-                        # Generate new filename
-                        new_name = self.rename_pattern.get().format(code=new_code)
-                        
-                        # Handle space replacement
-                        if self.replace_spaces.get():
-                            new_name = new_name.replace(' ', '_')
-                        
-                        # Add back the extension
-                        new_name_with_ext = new_name + ext
-                        
-                        # Store and display the match
-                        self.files_data.append((filename, new_name_with_ext))
-                        matched_files += 1
-                        self.tree.insert("", END, values=(filename, new_name_with_ext))
-                else:
-                    # Track unmatched files
-                    unmatched_files.append(filename)
-
-        # Calculate match percentage for the progress bar
-        match_percentage = (matched_files / total_files * 100) if total_files > 0 else 0
-
-        # Create HTML for the progress bar
-        progress_html = f'''
-        <div class="w-full p-4">
-            <div class="relative w-full h-8 bg-gray-200 rounded-lg overflow-hidden">
-                <div class="absolute top-0 left-0 h-full bg-blue-500 transition-all duration-500" 
-                     style="width: {match_percentage}%">
-                </div>
-                <div class="absolute top-0 left-0 w-full h-full flex items-center justify-center">
-                    <span class="text-sm font-medium {('text-white' if match_percentage > 50 else 'text-gray-700')}">
-                        {matched_files} / {total_files} files matched ({match_percentage:.1f}%)
-                    </span>
-                </div>
-            </div>
-            <div class="mt-2 text-sm text-gray-600">
-                {len(unmatched_files)} files did not match the pattern
-            </div>
-        </div>
-        '''
+            self.finish_scan(scan)
+        except Exception:
+            self.scanning = False
+            self.set_converter_controls_enabled(True)
+            raise
+
+    def finish_scan(self, scan):
+        self.scanning = False
+        self.set_converter_controls_enabled(True)
+        
+        stats = scan['stats']
+        unmatched_files = scan['unmatched_files']
+        matched_files = stats['matched']
+        total_files = stats['total']
+        self.update_match_statistics(stats)
+
+        # Find colliding destinations before anything is renamed
+        collisions = self.analyze_collisions(scan['folder'], self.files_data, scan['folder_listing'])
+        self.show_preview_rows(collisions)
 
         # Update status text
         status_text = f"Preview: {matched_files}/{total_files} files matched pattern"
@@ -508,24 +996,12 @@ class FileTools:
             for f in unmatched_files:
                 status_text += f"\n - {f}"
         
+        collision_count = len(collisions['blocked'])
+        if collision_count:
+            status_text += f"\n{collision_count} files have conflicting destinations and will be skipped"
+        
         self.status_var.set(status_text)
 
-        try:
-            # Create and display the progress bar React component
-            progress_component = f'''<div id="file-match-progress">
-                <FileMatchProgress
-                    matched={matched_files}
-                    total={total_files}
-                    unmatched={len(unmatched_files)}
-                />
-            </div>'''
-            
-            # Update the progress display
-            self.progress_display.update()
-            
-        except Exception as e:
-            print(f"Error updating progress display: {e}")
-
         # Show unmatched files popup if any exist
         if unmatched_files:
             messagebox.showinfo(
@@ -533,39 +1009,414 @@ class FileTools:
                 f"The following {len(unmatched_files)} files did not match the pattern:\n\n" + 
                 "\n".join(f"• {f}" for f in unmatched_files)
             )
-       
+
+        if collisions['blocked']:
+            messagebox.showwarning("Filename Collisions", self.format_collisions(collisions))
+
+    def set_converter_controls_enabled(self, enabled):
+        for widget in self.converter_controls:
+            widget.state(['!disabled'] if enabled else ['disabled'])
+
+    def match_file(self, filename, compiled_pattern, country_names, stats, unmatched_files):
+        """Match one filename, queue its rename and bump the statistics counters."""
+        name, ext = os.path.splitext(filename)
+        match = compiled_pattern.match(name)
+        if not match:
+            # Track unmatched files
+            unmatched_files.append(filename)
+            return
+            
+        code = match.group('code')
+        # First try as country name
+        if code.lower() in country_names:
+            code_type = "country"
+        else:
+            # Then try as code
+            code_type = "code"
+        country_name, country_entry = self.find_country(code, code_type)
+        new_code = self.format_country(country_name, country_entry)
+        
+        if new_code:
+            # Apply case formatting
+            case_format = self.case_format.get()
+            if case_format == "lowercase":
+                new_code = new_code.lower()
+            elif case_format == "Capitalise":
+                new_code = new_code.title()
+            elif case_format == "UPPERCASE":
+                new_code = new_code.upper()
+            
+            # Generate new filename
+            new_name = self.rename_pattern.get().format(code=new_code)
+            
+            # Handle space replacement
+            if self.replace_spaces.get():
+                new_name = new_name.replace(' ', '_')
+            
+            # Add back the extension
+            new_name_with_ext = new_name + ext
+            
+            # Store the match and count it by detected type
+            self.files_data.append((filename, new_name_with_ext, country_name))
+            stats['matched'] += 1
+            stats['types'][self.detect_match_type(code, code_type)] += 1
+
+    def detect_match_type(self, code, code_type):
+        # Same priority as lookup_code, so "fr" counts as Alpha-2 even though
+        # it is also a language code and France's first language is French
+        if code_type == "country":
+            return "country"
+        _, match_type = self.lookup_code(code)
+        return match_type
+
+    def update_match_statistics(self, stats):
+        """Refresh the Match Statistics panel from the scan counters."""
+        scanned = stats['scanned']
+        total = stats['total']
+        matched = stats['matched']
+        elapsed = time.perf_counter() - stats['started']
+        rate = scanned / elapsed if elapsed > 0 else 0
+        match_rate = (matched / scanned * 100) if scanned else 0
+        
+        self.match_progress.configure(maximum=max(total, 1), value=scanned)
+        self.match_rate_var.set(f"Matched {matched}/{scanned} files ({match_rate:.1f}%), "
+                                f"scanned {scanned}/{total}")
+        self.match_breakdown_var.set("  ·  ".join(
+            f"{label}: {stats['types'][match_type]}" for match_type, label in self.MATCH_TYPES))
+        
+        if scanned >= total:
+            eta = "done"
+        elif rate:
+            eta = f"{(total - scanned) / rate:.0f}s"
+        else:
+            eta = "--"
+        self.match_speed_var.set(f"{rate:.0f} files/s  ·  ETA {eta}")
+
+    def reset_match_statistics(self):
+        self.match_progress.configure(value=0)
+        self.match_rate_var.set("No scan yet")
+        self.match_breakdown_var.set("  ·  ".join(f"{label}: 0" for _, label in self.MATCH_TYPES))
+        self.match_speed_var.set("")
+
     def apply_changes(self):
+        if self.scanning:
+            return
+            
         if not self.files_data:
             messagebox.showwarning("Warning", "Please preview changes first")
             return
             
         errors = []
         success_count = 0
+        metadata_jobs = []
+        collisions = self.analyze_collisions(self.current_folder.get(), self.files_data)
         
-        for old_name, new_name in self.files_data:
-            try:
-                old_path = os.path.join(self.current_folder.get(), old_name)
-                new_path = os.path.join(self.current_folder.get(), new_name)
-                
-                if os.path.exists(new_path):
-                    errors.append(f"Skipped {old_name}: Destination file already exists")
-                    continue
-                    
-                os.rename(old_path, new_path)
-                success_count += 1
+        renames = []
+        
+        for old_name, new_name, country_name in self.files_data:
+            if old_name in collisions['blocked']:
+                errors.append(f"Skipped {old_name}: {collisions['blocked'][old_name]}")
+                continue
+            renames.append((old_name, new_name, country_name))
+            
+        # Collisions are excluded above, so the remaining renames are independent
+        io_layer = self.create_io_layer()
+        folder = self.current_folder.get()
+        results = io_layer.gather(io_layer.rename, [
+            (os.path.join(folder, old_name), os.path.join(folder, new_name))
+            for old_name, new_name, _ in renames
+        ])
+        
+        for (old_name, new_name, country_name), result in zip(renames, results):
+            if isinstance(result, Exception):
+                errors.append(f"Error renaming {old_name}: {str(result)}")
+                continue
                 
-            except Exception as e:
-                errors.append(f"Error renaming {old_name}: {str(e)}")
+            success_count += 1
+            stem, ext = os.path.splitext(new_name)
+            if ext.lower() in self.OFFICE_METADATA_EXTENSIONS:
+                metadata_jobs.append((os.path.join(folder, new_name), stem, country_name))
                 
         message = f"Successfully renamed {success_count} files."
+        if self.update_office_metadata.get() and metadata_jobs:
+            updated_count, metadata_errors = self.sync_office_metadata(metadata_jobs)
+            message += f"\nUpdated Office metadata in {updated_count} files."
+            errors.extend(metadata_errors)
         if errors:
             message += "\n\nErrors:\n" + "\n".join(errors)
             
         messagebox.showinfo("Results", message)
-        self.status_var.set(f"Renamed {success_count} files")
+        self.status_var.set(f"Renamed {success_count} files ({io_layer.iops:.0f} ops/s)")
         
         self.preview_changes()
 
+    def is_case_insensitive(self, folder):
+        """Probe whether folder lives on a case-insensitive filesystem.
+
+        The probe writes a temporary file, so the answer is cached per folder.
+        """
+        folder_key = os.path.abspath(folder)
+        if folder_key not in self.case_insensitive_folders:
+            try:
+                with tempfile.NamedTemporaryFile(prefix='.alchemist_probe_', dir=folder) as probe:
+                    probe_name = os.path.basename(probe.name)
+                    result = os.path.exists(os.path.join(folder, probe_name.swapcase()))
+            except OSError:
+                # Read-only folder: fall back to the platform default
+                result = sys.platform in ('win32', 'darwin')
+            self.case_insensitive_folders[folder_key] = result
+        return self.case_insensitive_folders[folder_key]
+
+    def analyze_collisions(self, folder, files_data, folder_listing=None):
+        """Index destination names and find every rename that would collide.
+
+        Uses one directory read (or the listing the caller already has) and
+        hashes names, case-folded when the filesystem ignores case. Returns a
+        dict with 'duplicates' (destination -> sources sharing it), 'existing'
+        (source -> file already on disk) and 'blocked' (source -> reason).
+        """
+        if folder_listing is None:
+            folder_listing = os.listdir(folder)
+            
+        if self.is_case_insensitive(folder):
+            fold = str.casefold
+        else:
+            fold = str
+            
+        existing_index = {fold(name): name for name in folder_listing}
+        destination_index = {}
+        for old_name, new_name, _ in files_data:
+            destination_index.setdefault(fold(new_name), []).append((old_name, new_name))
+            
+        duplicates = {}
+        existing = {}
+        blocked = {}
+        for key, entries in destination_index.items():
+            # A file that keeps its name (or only changes case) is not a collision itself,
+            # but it occupies the destination for every other source
+            staying = [old_name for old_name, _ in entries if fold(old_name) == key]
+            moving = [old_name for old_name, _ in entries if fold(old_name) != key]
+            
+            if len(moving) > 1 and not staying:
+                destination = entries[0][1]
+                duplicates[destination] = moving
+                for old_name in moving:
+                    blocked[old_name] = f"{len(moving)} files would be renamed to {destination}"
+                continue
+                
+            if key in existing_index:
+                for old_name in moving:
+                    existing[old_name] = existing_index[key]
+                    blocked[old_name] = f"Destination file {existing_index[key]} already exists"
+                
+        return {'duplicates': duplicates, 'existing': existing, 'blocked': blocked}
+
+    def show_preview_rows(self, collisions):
+        # Colliding renames are listed first, grouped by destination
+        for destination, sources in collisions['duplicates'].items():
+            for old_name in sources:
+                self.tree.insert("", END, values=(old_name, destination, f"Duplicate target ({len(sources)})"),
+                                 tags=("collision",))
+                
+        new_names = {old_name: new_name for old_name, new_name, _ in self.files_data}
+        for old_name in collisions['existing']:
+            self.tree.insert("", END, values=(old_name, new_names[old_name], "Already exists"),
+                             tags=("collision",))
+            
+        for old_name, new_name, _ in self.files_data:
+            if old_name not in collisions['blocked']:
+                self.tree.insert("", END, values=(old_name, new_name, "OK"))
+
+    def format_collisions(self, collisions):
+        lines = []
+        if collisions['duplicates']:
+            lines.append("Several files would be renamed to the same name:")
+            for destination, sources in collisions['duplicates'].items():
+                lines.append(f"\n{destination}")
+                lines.extend(f"   • {old_name}" for old_name in sources)
+        if collisions['existing']:
+            if lines:
+                lines.append("")
+            lines.append("Destination already exists in the folder:")
+            for old_name, existing_name in collisions['existing'].items():
+                lines.append(f"   • {old_name} → {existing_name}")
+        lines.append("\nThese files will be skipped when applying changes.")
+        return "\n".join(lines)
+
+    def sync_office_metadata(self, jobs):
+        """Update the docProps of renamed Office files concurrently.
+
+        jobs is a list of (path, title, country_name) tuples. Returns the number
+        of updated files and a list of error messages.
+        """
+        updated_count = 0
+        errors = []
+        
+        io_layer = self.create_io_layer()
+        results = io_layer.gather(partial(io_layer.run, self.write_office_metadata), jobs)
+        for (path, _, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                errors.append(f"Error updating metadata in {os.path.basename(path)}: {str(result)}")
+            else:
+                updated_count += 1
+                    
+        return updated_count, errors
+
+    def write_office_metadata(self, path, title, country_name):
+        """Set title, subject and the custom country property of a DOCX/XLSX file.
+
+        Only the docProps parts (plus the package manifests when custom.xml has
+        to be created) are rewritten; every other member's compressed bytes are
+        copied across in chunks, so large workbooks are never inflated. The
+        rewritten file is checked with testzip() before it replaces the original.
+        """
+        country_data = self.country_mappings.get(country_name, {})
+        subject = country_name.title() if country_name else None
+        country_code = country_data.get('alpha2', '').upper()
+        
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(path) as source, zipfile.ZipFile(temp_path, 'w') as target:
+                has_custom = 'docProps/custom.xml' in source.namelist()
+                
+                for info in source.infolist():
+                    if info.filename == 'docProps/core.xml':
+                        data = self.build_core_properties(source.read(info), title, subject)
+                    elif info.filename == 'docProps/custom.xml' and country_code:
+                        data = self.build_custom_properties(source.read(info), country_code)
+                    elif info.filename == '[Content_Types].xml' and not has_custom and country_code:
+                        data = self.add_custom_content_type(source.read(info))
+                    elif info.filename == '_rels/.rels' and not has_custom and country_code:
+                        data = self.add_custom_relationship(source.read(info))
+                    else:
+                        self.copy_zip_member(source, target, info)
+                        continue
+                    target.writestr(self.clone_zip_info(info), data)
+                    
+                if not has_custom and country_code:
+                    info = zipfile.ZipInfo('docProps/custom.xml', date_time=datetime.now().timetuple()[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    target.writestr(info, self.build_custom_properties(None, country_code))
+                    
+            # The raw copy relies on zipfile internals, never trust it blindly
+            with zipfile.ZipFile(temp_path) as written:
+                bad_member = written.testzip()
+            if bad_member is not None:
+                raise zipfile.BadZipFile(f"rewritten file failed verification at {bad_member}, original kept")
+                
+            shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+            
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def clone_zip_info(self, info):
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.external_attr = info.external_attr
+        new_info.file_size = info.file_size
+        return new_info
+
+    def copy_zip_member(self, source, target, info):
+        """Copy a member's compressed bytes across without inflating or recompressing them.
+
+        zipfile has no public raw-copy API, so this writes the local header
+        and data itself and registers the entry the way ZipFile.open does.
+        Encrypted members fall back to a streamed decompress/recompress.
+        """
+        new_info = self.clone_zip_info(info)
+        if info.is_dir():
+            target.writestr(new_info, b'')
+            return
+            
+        if info.flag_bits & 0x1:
+            with source.open(info) as src, target.open(new_info, 'w') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            return
+            
+        # Keep the deflate option bits, drop the data descriptor bit since sizes are known
+        new_info.flag_bits = info.flag_bits & ~0x08
+        new_info.CRC = info.CRC
+        new_info.compress_size = info.compress_size
+        
+        # Skip the source's local header, whose extra field may differ from the central directory
+        source.fp.seek(info.header_offset)
+        local_header = source.fp.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+        source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        
+        zip64 = max(info.file_size, info.compress_size) > zipfile.ZIP64_LIMIT
+        target.fp.seek(target.start_dir)
+        new_info.header_offset = target.fp.tell()
+        target.fp.write(new_info.FileHeader(zip64))
+        
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.fp.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+            target.fp.write(chunk)
+            remaining -= len(chunk)
+            
+        target.filelist.append(new_info)
+        target.NameToInfo[new_info.filename] = new_info
+        target.start_dir = target.fp.tell()
+        target._didModify = True
+
+    def build_core_properties(self, xml_bytes, title, subject):
+        root = ET.fromstring(xml_bytes)
+        for tag, value in (('title', title), ('subject', subject)):
+            if value is None:
+                continue
+            element = root.find(f'dc:{tag}', self.OFFICE_NAMESPACES)
+            if element is None:
+                element = ET.SubElement(root, f"{{{self.OFFICE_NAMESPACES['dc']}}}{tag}")
+            element.text = value
+        return ET.tostring(root, encoding='UTF-8', xml_declaration=True)
+
+    def build_custom_properties(self, xml_bytes, country_code):
+        # Keep any existing custom properties and replace only our own
+        properties = []
+        if xml_bytes:
+            root = ET.fromstring(xml_bytes)
+            for prop in root.findall(f'{{{self.CUSTOM_PROPERTIES_NS}}}property'):
+                if prop.get('name') == self.CUSTOM_COUNTRY_PROPERTY:
+                    continue
+                value = "".join(ET.tostring(child, encoding='unicode') for child in prop)
+                properties.append((prop.get('fmtid', self.CUSTOM_PROPERTIES_FMTID), prop.get('name', ''), value))
+        properties.append((self.CUSTOM_PROPERTIES_FMTID, self.CUSTOM_COUNTRY_PROPERTY,
+                           f"<vt:lpwstr>{escape(country_code)}</vt:lpwstr>"))
+        
+        parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n',
+                 f'<Properties xmlns="{self.CUSTOM_PROPERTIES_NS}" xmlns:vt="{self.OFFICE_NAMESPACES["vt"]}">']
+        for pid, (fmtid, name, value) in enumerate(properties, start=2):
+            parts.append(f'<property fmtid={quoteattr(fmtid)} pid="{pid}" name={quoteattr(name)}>{value}</property>')
+        parts.append('</Properties>')
+        return "".join(parts).encode('utf-8')
+
+    def add_custom_content_type(self, xml_bytes):
+        override = (f'<Override PartName="/docProps/custom.xml" '
+                    f'ContentType="{self.CUSTOM_PROPERTIES_CONTENT_TYPE}"/>')
+        return self.insert_before_closing_tag(xml_bytes, b'</Types>', override.encode('utf-8'))
+
+    def add_custom_relationship(self, xml_bytes):
+        used_ids = set(re.findall(rb'Id="([^"]+)"', xml_bytes))
+        rel_number = 1
+        while f"rId{rel_number}".encode('utf-8') in used_ids:
+            rel_number += 1
+        relationship = (f'<Relationship Id="rId{rel_number}" '
+                        f'Type="{self.CUSTOM_PROPERTIES_RELATIONSHIP}" Target="docProps/custom.xml"/>')
+        return self.insert_before_closing_tag(xml_bytes, b'</Relationships>', relationship.encode('utf-8'))
+
+    def insert_before_closing_tag(self, xml_bytes, closing_tag, fragment):
+        head, found, tail = xml_bytes.rpartition(closing_tag)
+        if not found:
+            raise ValueError(f"Malformed package part, missing {closing_tag.decode('utf-8')}")
+        return head + fragment + closing_tag + tail
+
     def reset_ui(self):
         self.current_folder.set("")
         self.template_filename.set("")
@@ -574,10 +1425,12 @@ class FileTools:
         self.output_format.set(self.FORMAT_OPTIONS[0][1])
         self.case_format.set(self.CASE_OPTIONS[0][1])
         self.replace_spaces.set(False)
+        self.update_office_metadata.set(False)
         self.files_data = []
         self.template_parts = []
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.reset_match_statistics()
 
     def browse_folder(self):
         folder = filedialog.askdirectory()
@@ -619,20 +1472,29 @@ class FileTools:
         ttk.Entry(frame, textvariable=self.pages_to_remove, width=40).grid(row=1, column=1, sticky=(W, E))
         ttk.Label(frame, text="(comma-separated, e.g., 1,2,5)").grid(row=1, column=2, sticky=W)
         
+        # Fresh job option, otherwise files the ledger shows as done are skipped
+        self.fresh_pdf_job = BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Start a fresh job (archive the ledger and process every file again)",
+                       variable=self.fresh_pdf_job).grid(row=2, column=0, columnspan=3, sticky=W, pady=5)
+        
         # Preview and execute buttons
-        ttk.Button(frame, text="Preview Changes", command=self.preview_pdf_changes).grid(row=2, column=1)
-        ttk.Button(frame, text="Remove Pages", command=self.remove_pdf_pages).grid(row=2, column=2)
+        ttk.Button(frame, text="Preview Changes", command=self.preview_pdf_changes).grid(row=3, column=1)
+        ttk.Button(frame, text="Remove Pages", command=self.remove_pdf_pages).grid(row=3, column=2)
         
         # Preview area
         self.pdf_preview = ttk.Treeview(frame, columns=("File", "Pages", "Status"), show="headings")
         self.pdf_preview.heading("File", text="PDF File")
         self.pdf_preview.heading("Pages", text="Pages to Remove")
         self.pdf_preview.heading("Status", text="Status")
-        self.pdf_preview.grid(row=3, column=0, columnspan=3, sticky=(N, W, E, S))
+        self.pdf_preview.grid(row=4, column=0, columnspan=3, sticky=(N, W, E, S))
+        
+        # Status display
+        self.pdf_status = StringVar(value="Ready")
+        ttk.Label(frame, textvariable=self.pdf_status).grid(row=5, column=0, columnspan=3)
 
         # Configure grid weights
         frame.columnconfigure(1, weight=1)
-        frame.rowconfigure(3, weight=1)
+        frame.rowconfigure(4, weight=1)
 
     def setup_pdf_page_extractor(self):
         frame = ttk.Frame(self.pdf_extract_tab, padding="10")
@@ -669,6 +1531,59 @@ class FileTools:
         # Configure grid weights
         frame.columnconfigure(1, weight=1)
 
+    def setup_pdf_merger(self):
+        frame = ttk.Frame(self.pdf_merge_tab, padding="10")
+        frame.grid(row=0, column=0, sticky=(N, W, E, S))
+        
+        # Folder selection
+        ttk.Label(frame, text="PDF Folder:").grid(row=0, column=0, sticky=W)
+        self.merge_folder = StringVar()
+        ttk.Entry(frame, textvariable=self.merge_folder, width=40).grid(row=0, column=1, sticky=(W, E))
+        ttk.Button(frame, text="Browse", command=self.browse_merge_folder).grid(row=0, column=2)
+        
+        # Merge order
+        ttk.Label(frame, text="Order:").grid(row=1, column=0, sticky=W)
+        self.merge_order = StringVar(value=self.MERGE_ORDER_OPTIONS[0])
+        ttk.Combobox(frame,
+                     textvariable=self.merge_order,
+                     values=self.MERGE_ORDER_OPTIONS,
+                     state="readonly",
+                     width=37).grid(row=1, column=1, sticky=(W, E))
+        
+        # Manifest selection
+        ttk.Label(frame, text="Manifest:").grid(row=2, column=0, sticky=W)
+        self.merge_manifest = StringVar()
+        ttk.Entry(frame, textvariable=self.merge_manifest, width=40).grid(row=2, column=1, sticky=(W, E))
+        ttk.Button(frame, text="Browse", command=self.browse_merge_manifest).grid(row=2, column=2)
+        ttk.Label(frame, text="(text file, one PDF filename per line)").grid(row=3, column=1, sticky=W)
+        
+        # Output file selection
+        ttk.Label(frame, text="Output File:").grid(row=4, column=0, sticky=W)
+        self.merge_output = StringVar()
+        ttk.Entry(frame, textvariable=self.merge_output, width=40).grid(row=4, column=1, sticky=(W, E))
+        ttk.Button(frame, text="Browse", command=self.browse_merge_output).grid(row=4, column=2)
+        
+        # Preview and execute buttons
+        ttk.Button(frame, text="Preview Order", command=self.preview_merge_order).grid(row=5, column=1)
+        ttk.Button(frame, text="Merge PDFs", command=self.merge_pdfs).grid(row=5, column=2)
+        
+        # Preview area
+        self.merge_preview = ttk.Treeview(frame, columns=("Order", "File", "Pages"), show="headings")
+        self.merge_preview.heading("Order", text="#")
+        self.merge_preview.heading("File", text="PDF File")
+        self.merge_preview.heading("Pages", text="Pages")
+        self.merge_preview.column("Order", width=50)
+        self.merge_preview.column("Pages", width=80)
+        self.merge_preview.grid(row=6, column=0, columnspan=3, sticky=(N, W, E, S))
+        
+        # Status display
+        self.merge_status = StringVar(value="Ready")
+        ttk.Label(frame, textvariable=self.merge_status).grid(row=7, column=0, columnspan=3)
+
+        # Configure grid weights
+        frame.columnconfigure(1, weight=1)
+        frame.rowconfigure(6, weight=1)
+
     def browse_pdf_folder(self):
         folder = filedialog.askdirectory()
         if folder:
@@ -686,6 +1601,259 @@ class FileTools:
         if folder:
             self.extract_output_folder.set(folder)
 
+    def browse_merge_folder(self):
+        folder = filedialog.askdirectory()
+        if folder:
+            self.merge_folder.set(folder)
+            if not self.merge_output.get():
+                self.merge_output.set(os.path.join(folder, "merged.pdf"))
+
+    def browse_merge_manifest(self):
+        file = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if file:
+            self.merge_manifest.set(file)
+            self.merge_order.set(self.MERGE_ORDER_OPTIONS[2])
+
+    def browse_merge_output(self):
+        file = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
+        if file:
+            self.merge_output.set(file)
+
+    def get_merge_inputs(self):
+        """Return the ordered list of PDF paths to merge, or None after reporting an error."""
+        folder = self.merge_folder.get()
+        if not folder:
+            messagebox.showwarning("Warning", "Please select a PDF folder")
+            return None
+            
+        output_path = os.path.abspath(self.merge_output.get()) if self.merge_output.get() else None
+        order = self.merge_order.get()
+        
+        if order == self.MERGE_ORDER_OPTIONS[2]:
+            if not self.merge_manifest.get():
+                messagebox.showwarning("Warning", "Please select a manifest file")
+                return None
+            try:
+                with open(self.merge_manifest.get(), 'r', encoding='utf-8') as f:
+                    filenames = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            except (OSError, UnicodeDecodeError) as e:
+                messagebox.showerror("Error", f"Could not read manifest: {str(e)}")
+                return None
+            missing = [name for name in filenames if not os.path.isfile(os.path.join(folder, name))]
+            if missing:
+                messagebox.showerror("Error", "Files listed in the manifest were not found:\n\n" +
+                                     "\n".join(f"• {name}" for name in missing))
+                return None
+        else:
+            try:
+                filenames = [name for name in os.listdir(folder) if name.lower().endswith('.pdf')]
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not read folder: {str(e)}")
+                return None
+            if order == self.MERGE_ORDER_OPTIONS[1]:
+                filenames.sort(key=self.country_sort_key)
+            else:
+                filenames.sort(key=str.lower)
+                
+        paths = [os.path.join(folder, name) for name in filenames]
+        return [path for path in paths if os.path.abspath(path) != output_path]
+
+    def country_sort_key(self, filename):
+        # Files with a detected country sort by alpha-2 code, the rest go last
+        country_name = self.detect_filename_country(os.path.splitext(filename)[0])
+        if country_name:
+            return (0, self.country_mappings[country_name]['alpha2'].lower(), filename.lower())
+        return (1, "", filename.lower())
+
+    def detect_filename_country(self, name):
+        """Find the country in a filename, or None.
+
+        A name matching the converter's search pattern uses its code group.
+        Otherwise full country names are looked for as whole words, then an
+        ISO or language code as the last delimited part, so "annex_fr" is
+        France while words like "in" or "no" elsewhere in a name are not.
+        """
+        code = self.pattern_code(name)
+        if code:
+            country_name = self.code_index['country'].get(code.lower()) or self.lookup_code(code)[0]
+            if country_name:
+                return country_name
+                
+        # Longest names first, so "papua new guinea" is not taken for "guinea"
+        words = re.findall(r'[^\W\d_]+', name.lower())
+        padded_name = f" {' '.join(words)} "
+        for country_lower, country in sorted(self.code_index['country'].items(), key=lambda item: -len(item[0])):
+            country_words = " ".join(re.findall(r'[^\W\d_]+', country_lower))
+            if country_words and f" {country_words} " in padded_name:
+                return country
+                
+        parts = [part for part in re.split(r'[\W_]+', name) if part]
+        if parts:
+            country_name, _ = self.lookup_code(parts[-1])
+            return country_name
+        return None
+
+    def pattern_code(self, name):
+        """The code group of the converter's search pattern in name, or None."""
+        pattern = self.search_pattern.get()
+        if not pattern:
+            return None
+        try:
+            compiled_pattern = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            return None
+        if 'code' not in compiled_pattern.groupindex:
+            return None
+        match = compiled_pattern.match(name)
+        return match.group('code') if match else None
+
+    def preview_merge_order(self):
+        paths = self.get_merge_inputs()
+        if paths is None:
+            return
+            
+        for item in self.merge_preview.get_children():
+            self.merge_preview.delete(item)
+            
+        # PDFs are opened concurrently, rows are shown in merge order
+        io_layer = self.create_io_layer()
+        page_counts = io_layer.gather(io_layer.pdf_page_count, paths)
+        for index, (path, pages) in enumerate(zip(paths, page_counts), start=1):
+            if isinstance(pages, Exception):
+                pages = f"Error: {str(pages)}"
+            self.merge_preview.insert("", END, values=(index, os.path.basename(path), pages))
+                
+        self.merge_status.set(f"{len(paths)} files will be merged ({io_layer.iops:.0f} ops/s)")
+
+    def merge_pdfs(self):
+        paths = self.get_merge_inputs()
+        if paths is None:
+            return
+            
+        if not paths:
+            messagebox.showwarning("Warning", "No PDF files to merge")
+            return
+            
+        if not self.merge_output.get():
+            messagebox.showwarning("Warning", "Please select an output file")
+            return
+            
+        output_path = self.merge_output.get()
+        temp_path = f"{output_path}.tmp"
+        writer = PdfWriter()
+        shared_resources = {}
+        reused_count = 0
+        page_count = 0
+        current_path = None
+        
+        try:
+            # Inputs are opened one at a time, but PdfWriter keeps a copy of every
+            # page until write(), so memory grows with the size of the merged output
+            for index, current_path in enumerate(paths):
+                reader = PdfReader(current_path)
+                fingerprints = {}
+                for page in reader.pages:
+                    reused_count += self.add_page_deduplicated(writer, page, shared_resources, fingerprints)
+                    page_count += 1
+                reader = None
+                self.merge_status.set(f"Merged {index + 1}/{len(paths)} files")
+                self.root.update_idletasks()
+            current_path = None
+                    
+            with open(temp_path, 'wb') as output_file:
+                writer.write(output_file)
+            os.replace(temp_path, output_path)
+            
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            self.merge_status.set("Error occurred during merge")
+            failed_file = os.path.basename(current_path or output_path)
+            messagebox.showerror("Error", f"Error merging {failed_file}: {str(e)}")
+            return
+            
+        self.merge_status.set(f"Merged {len(paths)} files ({page_count} pages), "
+                              f"{reused_count} shared resources reused")
+        messagebox.showinfo("Success", f"Merged {len(paths)} files into {os.path.basename(output_path)}")
+
+    def add_page_deduplicated(self, writer, page, shared_resources, fingerprints):
+        """Add page to writer, pointing identical fonts/images at copies already written.
+
+        shared_resources maps a content fingerprint to the writer's indirect
+        reference. fingerprints caches hashes for the current input, keyed by
+        (document id, object number, generation), so a font used on every
+        page is hashed once. Returns the number of resources that were reused.
+        """
+        new_resources = []
+        reused_count = 0
+        resources = page['/Resources'] if '/Resources' in page else None
+        
+        if isinstance(resources, DictionaryObject):
+            for category in ('/Font', '/XObject'):
+                entries = resources[category] if category in resources else None
+                if not isinstance(entries, DictionaryObject):
+                    continue
+                for name in list(entries.keys()):
+                    reference = entries.raw_get(name)
+                    if not isinstance(reference, IndirectObject):
+                        continue
+                    fingerprint_key = (id(reference.pdf), reference.idnum, reference.generation)
+                    if fingerprint_key not in fingerprints:
+                        fingerprints[fingerprint_key] = self.pdf_object_fingerprint(reference)
+                    fingerprint = fingerprints[fingerprint_key]
+                    if fingerprint in shared_resources:
+                        entries[NameObject(name)] = shared_resources[fingerprint]
+                        reused_count += 1
+                    else:
+                        new_resources.append((category, name, fingerprint))
+                        
+        added_page = writer.add_page(page)
+        
+        if new_resources:
+            added_resources = added_page['/Resources']
+            for category, name, fingerprint in new_resources:
+                shared_resources.setdefault(fingerprint, added_resources[category].raw_get(name))
+                
+        return reused_count
+
+    def pdf_object_fingerprint(self, obj, digest=None, visiting=None):
+        """Hash a PDF object by content, following indirect references."""
+        top_level = digest is None
+        if top_level:
+            digest = hashlib.sha256()
+            visiting = set()
+            
+        obj = obj.get_object()
+        if id(obj) in visiting:
+            digest.update(b'<cycle>')
+            return None
+        
+        if isinstance(obj, DictionaryObject):
+            visiting.add(id(obj))
+            digest.update(b'<<')
+            for key in sorted(obj.keys()):
+                if key == '/Parent':
+                    continue
+                digest.update(key.encode('utf-8'))
+                self.pdf_object_fingerprint(obj.raw_get(key), digest, visiting)
+            digest.update(b'>>')
+            # Stream payloads are hashed in their stored (encoded) form
+            digest.update(getattr(obj, '_data', None) or b'')
+            visiting.discard(id(obj))
+        elif isinstance(obj, ArrayObject):
+            visiting.add(id(obj))
+            digest.update(b'[')
+            for item in obj:
+                self.pdf_object_fingerprint(item, digest, visiting)
+            digest.update(b']')
+            visiting.discard(id(obj))
+        else:
+            digest.update(repr(obj).encode('utf-8'))
+            
+        if top_level:
+            return digest.hexdigest()
+        return None
+
     def preview_pdf_changes(self):
         if not self.pdf_folder.get():
             messagebox.showwarning("Warning", "Please select a PDF folder")
@@ -700,16 +1868,43 @@ class FileTools:
         for item in self.pdf_preview.get_children():
             self.pdf_preview.delete(item)
             
-        for filename in os.listdir(self.pdf_folder.get()):
-            if filename.lower().endswith('.pdf'):
-                filepath = os.path.join(self.pdf_folder.get(), filename)
-                try:
-                    reader = PdfReader(filepath)
-                    total_pages = len(reader.pages)
+        # Open all PDFs concurrently, then list them in folder order
+        io_layer = self.create_io_layer()
+        folder = self.pdf_folder.get()
+        listing = io_layer.gather(io_layer.listdir, [folder])[0]
+        if isinstance(listing, Exception):
+            messagebox.showerror("Error", f"Could not read folder: {str(listing)}")
+            return
+        filenames = [f for f in listing if f.lower().endswith('.pdf')]
+        paths = [os.path.join(folder, f) for f in filenames]
+        page_counts = io_layer.gather(io_layer.pdf_page_count, paths)
+        
+        # Match Remove Pages, which skips files the ledger shows as done
+        if self.fresh_pdf_job.get():
+            done = [False] * len(paths)
+        else:
+            ledger = JobLedger(folder)
+            operation = self.page_removal_operation(pages)
+            hashes = io_layer.gather(partial(io_layer.run, JobLedger.hash_file), paths)
+            done = [not isinstance(h, Exception) and ledger.is_done(operation, h) for h in hashes]
+        
+        for filename, total_pages, already_done in zip(filenames, page_counts, done):
+            try:
+                if isinstance(total_pages, Exception):
+                    raise total_pages
+                if already_done:
+                    status = "Already processed"
+                else:
                     status = "OK" if max(pages) <= total_pages else "Invalid pages"
-                    self.pdf_preview.insert("", END, values=(filename, self.pages_to_remove.get(), status))
-                except Exception as e:
-                    self.pdf_preview.insert("", END, values=(filename, "", f"Error: {str(e)}"))
+                self.pdf_preview.insert("", END, values=(filename, self.pages_to_remove.get(), status))
+            except Exception as e:
+                self.pdf_preview.insert("", END, values=(filename, "", f"Error: {str(e)}"))
+                
+        self.pdf_status.set(f"Checked {len(filenames)} files ({io_layer.iops:.0f} ops/s)")
+
+    def page_removal_operation(self, pages):
+        """Ledger and cache name of removing the given 1-based pages."""
+        return "remove_pages:" + ",".join(str(p) for p in sorted(set(pages)))
 
     def remove_pdf_pages(self):
             if not self.pdf_folder.get():
@@ -723,44 +1918,103 @@ class FileTools:
                 messagebox.showerror("Error", "Invalid page numbers")
                 return
                 
-            success_count = 0
-            error_count = 0
+            folder = self.pdf_folder.get()
+            try:
+                filenames = sorted(f for f in os.listdir(folder) if f.lower().endswith('.pdf'))
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not read folder: {str(e)}")
+                return
+                
+            counts = {'success': 0, 'error': 0, 'skipped': 0}
             
-            for filename in os.listdir(self.pdf_folder.get()):
-                if filename.lower().endswith('.pdf'):
-                    file_path = os.path.join(self.pdf_folder.get(), filename)
-                    temp_path = os.path.join(self.pdf_folder.get(), f"temp_{filename}")
-                    
-                    try:
-                        # Create a temporary file with the modified content
-                        reader = PdfReader(file_path)
-                        writer = PdfWriter()
-                        
-                        for i in range(len(reader.pages)):
-                            if i not in pages_to_remove:
-                                writer.add_page(reader.pages[i])
-                        
-                        # Write to temporary file first
-                        with open(temp_path, 'wb') as temp_file:
-                            writer.write(temp_file)
+            # Rerunning the same removal skips files the ledger shows as done
+            operation = self.page_removal_operation(p + 1 for p in pages_to_remove)
+            ledger = JobLedger(folder)
+            if self.fresh_pdf_job.get():
+                try:
+                    ledger.archive()
+                except OSError as e:
+                    messagebox.showerror("Error", f"Could not archive the ledger: {str(e)}")
+                    return
+                # One fresh run, later runs resume from the new ledger again
+                self.fresh_pdf_job.set(False)
+            io_layer = self.create_io_layer()
+            # Orders ledger appends, which fsync, without blocking the event loop
+            ledger_lock = asyncio.Lock()
+            
+            async def remove_pages(filename):
+                file_path = os.path.join(folder, filename)
+                temp_path = os.path.join(folder, f".{filename}.tmp")
+                
+                try:
+                    # Hashing, parsing and writing run on the I/O pool
+                    result = await io_layer.run(self.prepare_page_removal, file_path, temp_path,
+                                                pages_to_remove, operation, ledger)
+                    if result is None:
+                        counts['skipped'] += 1
+                        return
                         
-                        # Close the reader to release the original file
-                        reader = None
-                        writer = None
+                    # Checkpoint, then atomically replace original with temporary file
+                    input_hash, output_hash = result
+                    
+                    def checkpoint():
+                        ledger.record(filename, operation, input_hash, output_hash)
+                        os.replace(temp_path, file_path)
                         
-                        # Replace original with temporary file
-                        os.remove(file_path)
-                        os.rename(temp_path, file_path)
-                        success_count += 1
+                    async with ledger_lock:
+                        await io_layer.run(checkpoint)
+                    counts['success'] += 1
+                    self.pdf_status.set(f"Processed {counts['success']} files, skipped {counts['skipped']}")
+                    self.root.update_idletasks()
+                    
+                except Exception as e:
+                    counts['error'] += 1
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)  # Clean up temp file if it exists
                         
-                    except Exception as e:
-                        error_count += 1
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)  # Clean up temp file if it exists
+            io_layer.gather(remove_pages, filenames)
                         
+            self.pdf_cache.save()
+            self.pdf_status.set(f"Processed {counts['success']} files, skipped {counts['skipped']} already done "
+                                f"({io_layer.iops:.0f} ops/s). {self.pdf_cache.stats()}")
             messagebox.showinfo("Results", 
-                            f"Successfully processed {success_count} files\n"
-                            f"Errors occurred in {error_count} files")
+                            f"Successfully processed {counts['success']} files\n"
+                            f"Skipped {counts['skipped']} files already processed in an earlier run\n"
+                            f"Errors occurred in {counts['error']} files\n\n"
+                            f"{self.pdf_cache.stats()}")
+
+    def prepare_page_removal(self, file_path, temp_path, pages_to_remove, operation, ledger):
+        """Write file_path minus pages_to_remove to temp_path.
+
+        Returns (input hash, output hash), or None if the ledger shows the file
+        was already processed. Safe to run on a worker thread.
+        """
+        input_hash = JobLedger.hash_file(file_path)
+        if ledger.is_done(operation, input_hash):
+            return None
+            
+        # Identical inputs reuse the output of an earlier run
+        output_hash = self.pdf_cache.fetch(input_hash, operation, temp_path)
+        if output_hash is None:
+            # Create a temporary file with the modified content
+            reader = PdfReader(file_path)
+            writer = PdfWriter()
+            
+            for i in range(len(reader.pages)):
+                if i not in pages_to_remove:
+                    writer.add_page(reader.pages[i])
+            
+            # Write to temporary file first
+            with open(temp_path, 'wb') as temp_file:
+                writer.write(temp_file)
+            
+            # Close the reader to release the original file
+            reader = None
+            writer = None
+            
+            output_hash = self.pdf_cache.store(input_hash, operation, temp_path)
+            
+        return input_hash, output_hash
 
     def extract_pdf_pages(self):
         if not self.extract_pdf_file.get():
@@ -786,20 +2040,27 @@ class FileTools:
         )
         
         try:
-            reader = PdfReader(input_path)
-            writer = PdfWriter()
-            
-            if start_page < 1 or end_page > len(reader.pages):
-                messagebox.showerror("Error", "Page numbers out of range")
-                return
-                
-            for i in range(start_page - 1, end_page):
-                writer.add_page(reader.pages[i])
+            # A cached excerpt of identical content is reused as is
+            operation = f"extract_pages:{start_page}-{end_page}"
+            input_hash = JobLedger.hash_file(input_path)
+            if self.pdf_cache.fetch(input_hash, operation, output_path) is None:
+                reader = PdfReader(input_path)
+                writer = PdfWriter()
                 
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
+                if start_page < 1 or end_page > len(reader.pages):
+                    messagebox.showerror("Error", "Page numbers out of range")
+                    return
+                    
+                for i in range(start_page - 1, end_page):
+                    writer.add_page(reader.pages[i])
+                    
+                with open(output_path, 'wb') as output_file:
+                    writer.write(output_file)
+                    
+                self.pdf_cache.store(input_hash, operation, output_path)
+            self.pdf_cache.save()
                 
-            self.extract_status.set(f"Successfully extracted pages {start_page}-{end_page}")
+            self.extract_status.set(f"Successfully extracted pages {start_page}-{end_page}. {self.pdf_cache.stats()}")
             messagebox.showinfo("Success", "Pages extracted successfully")
             
         except Exception as e: